@@ -1,40 +1,51 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from models.book import Book
-from services.book_service import BookService
+from services.book_service import BookService, get_book_service
 from core.security import get_current_user
 
 router = APIRouter(prefix="/books", tags=["books"])
 
 @router.post("/", response_model=Book)
-async def create_book(book: Book, service: BookService = Depends(), current_user = Depends(get_current_user)):
+async def create_book(book: Book, service: BookService = Depends(get_book_service), current_user = Depends(get_current_user)):
     """Create a new book."""
     return await service.create_book(book)
 
-@router.get("/", response_model=List[Book])
-async def get_all_books(service: BookService = Depends(), current_user = Depends(get_current_user)):
-    """Get all books."""
-    return await service.get_all_books()
+@router.post("/bulk", response_model=List[Book])
+async def create_books(books: List[Book], service: BookService = Depends(get_book_service), current_user = Depends(get_current_user)):
+    """Create several books at once."""
+    return await service.create_books(books)
+
+@router.get("/", response_model=List[Book], response_model_exclude_unset=True)
+async def get_all_books(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    fields: Optional[List[str]] = Query(None, description="Fields to return for each book"),
+    service: BookService = Depends(get_book_service),
+    current_user = Depends(get_current_user)
+):
+    """Get a page of books."""
+    return await service.get_all_books(skip=skip, limit=limit, fields=fields)
 
 @router.get("/{book_id}", response_model=Book)
-async def get_book(book_id: str, service: BookService = Depends(), current_user = Depends(get_current_user)):
+async def get_book(book_id: str, service: BookService = Depends(get_book_service), current_user = Depends(get_current_user)):
     """Get a book by ID."""
     return await service.get_book(book_id)
 
 @router.put("/{book_id}", response_model=Book)
-async def update_book(book_id: str, book: Book, service: BookService = Depends(), current_user = Depends(get_current_user)):
+async def update_book(book_id: str, book: Book, service: BookService = Depends(get_book_service), current_user = Depends(get_current_user)):
     """Update a book."""
     return await service.update_book(book_id, book)
 
 @router.delete("/{book_id}")
-async def delete_book(book_id: str, service: BookService = Depends(), current_user = Depends(get_current_user)):
+async def delete_book(book_id: str, service: BookService = Depends(get_book_service), current_user = Depends(get_current_user)):
     """Delete a book."""
     return await service.delete_book(book_id)
 
 @router.get("/search/", response_model=List[Book])
 async def search_books(
     query: str = Query(..., description="Search query for title, author, or genre"),
-    service: BookService = Depends(),
+    service: BookService = Depends(get_book_service),
     current_user = Depends(get_current_user)
 ):
     """Search books by title, author, or genre."""
@@ -43,7 +54,7 @@ async def search_books(
 @router.get("/series/{series_id}", response_model=List[Book])
 async def get_books_by_series(
     series_id: str,
-    service: BookService = Depends(),
+    service: BookService = Depends(get_book_service),
     current_user = Depends(get_current_user)
 ):
     """Get all books in a series."""
@@ -53,7 +64,7 @@ async def get_books_by_series(
 async def update_book_status(
     book_id: str,
     status: str = Query(..., description="New status (unread, reading, read)"),
-    service: BookService = Depends(),
+    service: BookService = Depends(get_book_service),
     current_user = Depends(get_current_user)
 ):
     """Update a book's status."""
@@ -63,7 +74,7 @@ async def update_book_status(
 async def update_book_rating(
     book_id: str,
     rating: int = Query(..., ge=1, le=5, description="Rating from 1 to 5"),
-    service: BookService = Depends(),
+    service: BookService = Depends(get_book_service),
     current_user = Depends(get_current_user)
 ):
     """Update a book's rating."""
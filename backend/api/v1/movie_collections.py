@@ -1,50 +1,61 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+import orjson
 from models.movie_collection import MovieCollection
-from services.movie_collection_service import MovieCollectionService
+from services.movie_collection_service import MovieCollectionService, get_movie_collection_service
 from core.security import get_current_user
 
 router = APIRouter(prefix="/movie-collections", tags=["movie-collections"])
 
 @router.post("/", response_model=MovieCollection)
-async def create_collection(collection: MovieCollection, service: MovieCollectionService = Depends(), current_user = Depends(get_current_user)):
+async def create_collection(collection: MovieCollection, service: MovieCollectionService = Depends(get_movie_collection_service), current_user = Depends(get_current_user)):
     """Create a new movie collection."""
     return await service.create_collection(collection)
 
 @router.get("/", response_model=List[MovieCollection])
-async def get_all_collections(service: MovieCollectionService = Depends(), current_user = Depends(get_current_user)):
+async def get_all_collections(service: MovieCollectionService = Depends(get_movie_collection_service), current_user = Depends(get_current_user)):
     """Get all movie collections."""
     return await service.get_all_collections()
 
+@router.get("/stream")
+async def stream_collections(service: MovieCollectionService = Depends(get_movie_collection_service), current_user = Depends(get_current_user)):
+    """Stream all movie collections as newline-delimited JSON."""
+    async def lines():
+        async for collection in service.iter_all_collections():
+            # Unvalidated documents keep their ObjectId _id, which orjson cannot encode itself
+            yield orjson.dumps(collection.model_dump(by_alias=True, warnings=False), default=str) + b"\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @router.get("/{collection_id}", response_model=MovieCollection)
-async def get_collection(collection_id: str, service: MovieCollectionService = Depends(), current_user = Depends(get_current_user)):
+async def get_collection(collection_id: str, service: MovieCollectionService = Depends(get_movie_collection_service), current_user = Depends(get_current_user)):
     """Get a movie collection by ID."""
     return await service.get_collection(collection_id)
 
 @router.put("/{collection_id}", response_model=MovieCollection)
-async def update_collection(collection_id: str, collection: MovieCollection, service: MovieCollectionService = Depends(), current_user = Depends(get_current_user)):
+async def update_collection(collection_id: str, collection: MovieCollection, service: MovieCollectionService = Depends(get_movie_collection_service), current_user = Depends(get_current_user)):
     """Update a movie collection."""
     return await service.update_collection(collection_id, collection)
 
 @router.delete("/{collection_id}")
-async def delete_collection(collection_id: str, service: MovieCollectionService = Depends(), current_user = Depends(get_current_user)):
+async def delete_collection(collection_id: str, service: MovieCollectionService = Depends(get_movie_collection_service), current_user = Depends(get_current_user)):
     """Delete a movie collection."""
     return await service.delete_collection(collection_id)
 
 @router.post("/{collection_id}/movies/{movie_id}")
-async def add_movie_to_collection(collection_id: str, movie_id: str, service: MovieCollectionService = Depends()):
+async def add_movie_to_collection(collection_id: str, movie_id: str, service: MovieCollectionService = Depends(get_movie_collection_service)):
     """Add a movie to a collection."""
     return await service.add_movie_to_collection(collection_id, movie_id)
 
 @router.delete("/{collection_id}/movies/{movie_id}")
-async def remove_movie_from_collection(collection_id: str, movie_id: str, service: MovieCollectionService = Depends()):
+async def remove_movie_from_collection(collection_id: str, movie_id: str, service: MovieCollectionService = Depends(get_movie_collection_service)):
     """Remove a movie from a collection."""
     return await service.remove_movie_from_collection(collection_id, movie_id)
 
 @router.get("/search/", response_model=List[MovieCollection])
 async def search_collections(
     query: str = Query(..., description="Search query for collection name or director"),
-    service: MovieCollectionService = Depends(),
+    service: MovieCollectionService = Depends(get_movie_collection_service),
     current_user = Depends(get_current_user)
 ):
     """Search movie collections by name or director."""
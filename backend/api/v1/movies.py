@@ -1,40 +1,51 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+import orjson
 from models.movie import Movie
-from services.movie_service import MovieService
+from services.movie_service import MovieService, get_movie_service
 from core.security import get_current_user
 
 router = APIRouter(prefix="/movies", tags=["movies"])
 
 @router.post("/", response_model=Movie)
-async def create_movie(movie: Movie, service: MovieService = Depends(), current_user = Depends(get_current_user)):
+async def create_movie(movie: Movie, service: MovieService = Depends(get_movie_service), current_user = Depends(get_current_user)):
     """Create a new movie."""
     return await service.create_movie(movie)
 
 @router.get("/", response_model=List[Movie])
-async def get_all_movies(service: MovieService = Depends(), current_user = Depends(get_current_user)):
+async def get_all_movies(service: MovieService = Depends(get_movie_service), current_user = Depends(get_current_user)):
     """Get all movies."""
     return await service.get_all_movies()
 
+@router.get("/stream")
+async def stream_movies(service: MovieService = Depends(get_movie_service), current_user = Depends(get_current_user)):
+    """Stream all movies as newline-delimited JSON."""
+    async def lines():
+        async for movie in service.iter_all_movies():
+            # Unvalidated documents keep their ObjectId _id, which orjson cannot encode itself
+            yield orjson.dumps(movie.model_dump(by_alias=True, warnings=False), default=str) + b"\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @router.get("/{movie_id}", response_model=Movie)
-async def get_movie(movie_id: str, service: MovieService = Depends(), current_user = Depends(get_current_user)):
+async def get_movie(movie_id: str, service: MovieService = Depends(get_movie_service), current_user = Depends(get_current_user)):
     """Get a movie by ID."""
     return await service.get_movie(movie_id)
 
 @router.put("/{movie_id}", response_model=Movie)
-async def update_movie(movie_id: str, movie: Movie, service: MovieService = Depends(), current_user = Depends(get_current_user)):
+async def update_movie(movie_id: str, movie: Movie, service: MovieService = Depends(get_movie_service), current_user = Depends(get_current_user)):
     """Update a movie."""
     return await service.update_movie(movie_id, movie)
 
 @router.delete("/{movie_id}")
-async def delete_movie(movie_id: str, service: MovieService = Depends(), current_user = Depends(get_current_user)):
+async def delete_movie(movie_id: str, service: MovieService = Depends(get_movie_service), current_user = Depends(get_current_user)):
     """Delete a movie."""
     return await service.delete_movie(movie_id)
 
 @router.get("/search/", response_model=List[Movie])
 async def search_movies(
     query: str = Query(..., description="Search query for title, director, or genre"),
-    service: MovieService = Depends(),
+    service: MovieService = Depends(get_movie_service),
     current_user = Depends(get_current_user)
 ):
     """Search movies by title, director, or genre."""
@@ -43,7 +54,7 @@ async def search_movies(
 @router.get("/collection/{collection_id}", response_model=List[Movie])
 async def get_movies_by_collection(
     collection_id: str,
-    service: MovieService = Depends(),
+    service: MovieService = Depends(get_movie_service),
     current_user = Depends(get_current_user)
 ):
     """Get all movies in a collection."""
@@ -53,7 +64,7 @@ async def get_movies_by_collection(
 async def update_movie_status(
     movie_id: str,
     status: str = Query(..., description="New status (unwatched, watching, watched)"),
-    service: MovieService = Depends(),
+    service: MovieService = Depends(get_movie_service),
     current_user = Depends(get_current_user)
 ):
     """Update a movie's status."""
@@ -63,7 +74,7 @@ async def update_movie_status(
 async def update_movie_rating(
     movie_id: str,
     rating: int = Query(..., ge=1, le=5, description="Rating from 1 to 5"),
-    service: MovieService = Depends(),
+    service: MovieService = Depends(get_movie_service),
     current_user = Depends(get_current_user)
 ):
     """Update a movie's rating."""
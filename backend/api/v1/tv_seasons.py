@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from typing import List, Optional
 from services.tv_season_service import get_tv_season_service, TVSeasonService
 from models.tv_season import TVSeason, TVSeasonCreate, TVSeasonUpdate
 
@@ -21,9 +21,10 @@ async def get_tv_seasons_by_show(
     show_id: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    after_id: Optional[str] = None,
     tv_season_service: TVSeasonService = Depends(get_tv_season_service)
 ):
-    return await tv_season_service.get_tv_seasons_by_show(show_id, skip=skip, limit=limit)
+    return await tv_season_service.get_tv_seasons_by_show(show_id, skip=skip, limit=limit, after_id=after_id)
 
 @router.put("/{tv_season_id}", response_model=TVSeason)
 async def update_tv_season(
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from services.tv_show_service import get_tv_show_service, TVShowService
-from models.tv_show import TVShow, TVShowCreate, TVShowUpdate
+from models.tv_show import TVShow, TVShowCreate, TVShowUpdate, TVShowSummary
 
 router = APIRouter(prefix="/tv-shows", tags=["tv-shows"])
 
@@ -9,6 +9,17 @@ router = APIRouter(prefix="/tv-shows", tags=["tv-shows"])
 async def create_tv_show(tv_show: TVShowCreate, tv_show_service: TVShowService = Depends(get_tv_show_service)):
     return await tv_show_service.create_tv_show(tv_show)
 
+@router.get("/summary", response_model=List[TVShowSummary])
+async def get_tv_show_summaries(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    title: Optional[str] = None,
+    status: Optional[str] = None,
+    after_id: Optional[str] = None,
+    tv_show_service: TVShowService = Depends(get_tv_show_service)
+):
+    return await tv_show_service.get_tv_show_summaries(skip=skip, limit=limit, title=title, status=status, after_id=after_id)
+
 @router.get("/{tv_show_id}", response_model=TVShow)
 async def get_tv_show(tv_show_id: str, tv_show_service: TVShowService = Depends(get_tv_show_service)):
     tv_show = await tv_show_service.get_tv_show(tv_show_id)
@@ -22,9 +33,10 @@ async def get_tv_shows(
     limit: int = Query(10, ge=1, le=100),
     title: Optional[str] = None,
     status: Optional[str] = None,
+    after_id: Optional[str] = None,
     tv_show_service: TVShowService = Depends(get_tv_show_service)
 ):
-    return await tv_show_service.get_tv_shows(skip=skip, limit=limit, title=title, status=status)
+    return await tv_show_service.get_tv_shows(skip=skip, limit=limit, title=title, status=status, after_id=after_id)
 
 @router.put("/{tv_show_id}", response_model=TVShow)
 async def update_tv_show(
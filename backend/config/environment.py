@@ -21,6 +21,18 @@ def get_mongodb_db_name() -> str:
     """Get the MongoDB database name."""
     return os.getenv("MONGODB_DB_NAME", "acm_db")
 
+def get_mongodb_max_pool_size() -> int:
+    """Get the maximum number of pooled MongoDB connections."""
+    return int(os.getenv("MONGODB_MAX_POOL_SIZE", "200"))
+
+def get_mongodb_min_pool_size() -> int:
+    """Get the number of MongoDB connections kept open when idle."""
+    return int(os.getenv("MONGODB_MIN_POOL_SIZE", "20"))
+
+def get_mongodb_compressors() -> str:
+    """Get the comma-separated MongoDB wire compressors."""
+    return os.getenv("MONGODB_COMPRESSORS", "zstd")
+
 def get_cors_origins() -> list:
     """Get the CORS origins."""
     origins = os.getenv("CORS_ORIGINS", "[]")
@@ -47,6 +59,8 @@ def get_configuration() -> dict:
             "Debug Mode": get_debug(),
             "MongoDB URL": get_mongodb_url(),
             "MongoDB Database": get_mongodb_db_name(),
+            "MongoDB Pool Size": f"{get_mongodb_min_pool_size()}-{get_mongodb_max_pool_size()}",
+            "MongoDB Compressors": get_mongodb_compressors(),
             "CORS Origins": get_cors_origins(),
             "Log File": get_log_file(),
             "Log Level": os.getenv("LOG_LEVEL", "INFO"),
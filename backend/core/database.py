@@ -1,9 +1,100 @@
+import asyncio
+from functools import lru_cache
+from typing import Optional
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
 from motor.motor_asyncio import AsyncIOMotorClient
-from config.environment import get_mongodb_url, get_mongodb_db_name
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+from config.environment import (
+    get_mongodb_url, get_mongodb_db_name, get_mongodb_max_pool_size,
+    get_mongodb_min_pool_size, get_mongodb_compressors, logger
+)
+from models.book import Book
+from models.book_series import BookSeries
+from models.movie import Movie
+from models.movie_collection import MovieCollection
+from models.tv_season import TVSeasonInDB
+from models.tv_show import TVShowInDB
+from models.user import User
 
-# Create MongoDB client
-client = AsyncIOMotorClient(get_mongodb_url())
+# Models whose Config declares a collection_name and its indexes
+INDEXED_MODELS = (Book, BookSeries, Movie, MovieCollection, TVSeasonInDB, TVShowInDB, User)
+
+# Collections whose unique indexes are the only guard against duplicates, so startup needs them
+REQUIRED_UNIQUE_INDEX_COLLECTIONS = {User.Config.collection_name}
+
+# MongoDB client, created on first use so it binds to the running event loop
+_client: Optional[AsyncIOMotorClient] = None
+
+def get_client() -> AsyncIOMotorClient:
+    """Get the MongoDB client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient(
+            get_mongodb_url(),
+            maxPoolSize=get_mongodb_max_pool_size(),
+            minPoolSize=get_mongodb_min_pool_size(),
+            compressors=get_mongodb_compressors(),
+            serverSelectionTimeoutMS=5000,
+            retryWrites=True,
+            uuidRepresentation="standard",
+            # Read datetimes back as timezone-aware UTC, matching what is written
+            tz_aware=True
+        )
+    return _client
 
 # Get database
+@lru_cache(maxsize=1)
 def get_database():
-    return client[get_mongodb_db_name()]
+    return get_client()[get_mongodb_db_name()]
+
+def _index_models(indexes: list) -> list:
+    return [
+        IndexModel(index["key"], **{k: v for k, v in index.items() if k != "key"})
+        for index in indexes
+    ]
+
+async def _create_index(collection, index: IndexModel):
+    # Each index is built on its own, so one conflict cannot drop the others.
+    # A conflicting existing index must not stop the application from starting,
+    # unless it is a unique index that nothing else backs up
+    try:
+        await collection.create_indexes([index])
+    except OperationFailure as e:
+        if index.document.get("unique") and collection.name in REQUIRED_UNIQUE_INDEX_COLLECTIONS:
+            logger.error(f"Could not create unique index {index.document['name']} on {collection.name}: {str(e)}")
+            raise
+        logger.warning(f"Could not create index {index.document['name']} on {collection.name}: {str(e)}")
+
+async def ensure_indexes():
+    """Create the indexes declared on each model, one concurrent request per index."""
+    db = get_database()
+    await asyncio.gather(*[
+        _create_index(db[model.Config.collection_name], index)
+        for model in INDEXED_MODELS
+        for index in _index_models(getattr(model.Config, "indexes", None) or [])
+    ])
+
+def parse_object_id(value: str) -> ObjectId:
+    """Parse a document ID from a request, rejecting malformed IDs with a 400."""
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail=f"Invalid ID: {value}")
+
+def convert_id(document: Optional[dict]) -> Optional[dict]:
+    """Expose a document's ObjectId "_id" as the string "id" the API models expect."""
+    if document:
+        document["id"] = str(document.pop("_id"))
+    return document
+
+@lru_cache(maxsize=None)
+def model_projection(model) -> dict:
+    """Project a query onto the fields a model declares, so nothing else is sent or decoded."""
+    return {field.alias or name: 1 for name, field in model.model_fields.items()}
+
+def search_cursor(collection, query: str, projection: Optional[dict] = None):
+    """Find documents whose text index matches any word of a query, best matches first."""
+    return collection.find({"$text": {"$search": query}}, projection).sort([("score", {"$meta": "textScore"})])
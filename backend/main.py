@@ -8,7 +8,7 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config.environment import get_debug, get_cors_origins, get_environment, logger, get_configuration, get_port, get_api_prefix
-from core.database import get_database
+from core.database import get_database, ensure_indexes
 from api.v1.api import router as api_router
 import logging
 from logging.handlers import RotatingFileHandler
@@ -72,6 +72,10 @@ async def startup_event():
         # Use admin command to test connection
         await db.command('ping')
         logger.info("Database connection successful")
+
+        # Create the indexes declared on the models
+        await ensure_indexes()
+        logger.info("Database indexes ensured")
         
         # Get collections and database info
         collections = await db.list_collection_names()
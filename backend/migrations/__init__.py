@@ -0,0 +1,3 @@
+"""
+One-off data migrations, run by hand from the backend directory.
+"""
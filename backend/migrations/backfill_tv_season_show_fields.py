@@ -0,0 +1,19 @@
+"""
+Copy the show title and poster onto TV seasons stored before they were denormalized.
+
+Run once from the backend directory:
+    python -m migrations.backfill_tv_season_show_fields
+"""
+
+import asyncio
+from config.environment import logger
+from core.database import get_client
+from services.tv_season_service import get_tv_season_service
+
+async def main():
+    backfilled = await get_tv_season_service().backfill_show_summaries()
+    logger.info(f"Backfilled show fields on {backfilled} TV seasons")
+    get_client().close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
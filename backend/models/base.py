@@ -2,14 +2,30 @@
 Base model for MongoDB documents.
 """
 
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from typing import Annotated, Optional
+from pydantic import BaseModel, Field, StringConstraints
+
+
+def utcnow() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+def stamp_created(model: BaseModel, now: datetime) -> None:
+    """Give a new model one creation timestamp, unless the client supplied its own."""
+    for field in ("created_at", "updated_at"):
+        if field not in model.model_fields_set:
+            setattr(model, field, now)
+
+# Shared string constraints, so models reuse one validator per shape
+TitleStr = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+DescriptionStr = Annotated[str, StringConstraints(max_length=1000)]
+ImdbIdStr = Annotated[str, StringConstraints(pattern=r"^tt[0-9]{7,8}$")]
 
 class BaseDBModel(BaseModel):
     """
     Base model for all database models.
     """
     id: Optional[str] = Field(alias="_id", default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow) 
\ No newline at end of file
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow) 
\ No newline at end of file
@@ -3,8 +3,9 @@ Book model for the application.
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, Tuple
 from pydantic import BaseModel, Field
+from .base import utcnow
 
 class Book(BaseModel):
     id: Optional[str] = Field(None, alias="_id")
@@ -22,9 +23,9 @@ class Book(BaseModel):
     notes: Optional[str] = None
     series_id: Optional[str] = None
     series_order: Optional[int] = None
-    tags: List[str] = []
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    tags: Tuple[str, ...] = ()
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     class Config:
         collection_name = "acm_books"
@@ -46,9 +47,10 @@ class Book(BaseModel):
         indexes = [
             {"key": [("title", 1)]},
             {"key": [("author", 1)]},
-            {"key": [("isbn", 1)], "unique": True, "sparse": True},
+            {"key": [("isbn", 1)], "unique": True, "partialFilterExpression": {"isbn": {"$type": "string"}}},
             {"key": [("genre", 1)]},
             {"key": [("status", 1)]},
             {"key": [("series_id", 1)]},
-            {"key": [("tags", 1)]}
+            {"key": [("tags", 1)]},
+            {"key": [("title", "text"), ("author", "text"), ("genre", "text")], "name": "search_text"}
         ] 
\ No newline at end of file
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pydantic import BaseModel, Field
+from .base import utcnow
 
 class BookSeries(BaseModel):
     id: Optional[str] = Field(None, alias="_id")
@@ -12,9 +13,9 @@ class BookSeries(BaseModel):
     status: str = "ongoing"  # ongoing, completed, cancelled
     book_ids: List[str] = []
     notes: Optional[str] = None
-    tags: List[str] = []
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    tags: Tuple[str, ...] = ()
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     class Config:
         collection_name = "acm_book_series"
@@ -30,3 +31,6 @@ class BookSeries(BaseModel):
             }
         }
         populate_by_name = True
+        indexes = [
+            {"key": [("name", "text"), ("author", "text")], "name": "search_text"}
+        ]
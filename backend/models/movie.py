@@ -3,8 +3,9 @@ Movie model for the application.
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, Tuple
 from pydantic import BaseModel, Field
+from .base import utcnow
 
 class Movie(BaseModel):
     id: Optional[str] = Field(None, alias="_id")
@@ -22,10 +23,10 @@ class Movie(BaseModel):
     collection_id: Optional[str] = None
     collection_order: Optional[int] = None
     studio: Optional[str] = None
-    cast: List[str] = []
-    tags: List[str] = []
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    cast: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     class Config:
         collection_name = "acm_movies"
@@ -53,5 +54,6 @@ class Movie(BaseModel):
             {"key": [("status", 1)]},
             {"key": [("collection_id", 1)]},
             {"key": [("studio", 1)]},
-            {"key": [("tags", 1)]}
+            {"key": [("tags", 1)]},
+            {"key": [("title", "text"), ("director", "text"), ("genre", "text")], "name": "search_text"}
         ] 
\ No newline at end of file
@@ -1,19 +1,26 @@
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Optional, List, Tuple
+from pydantic import BaseModel, Field, field_validator
+from .base import utcnow
 
 class MovieCollection(BaseModel):
     id: Optional[str] = Field(None, alias="_id")
     name: str
     description: Optional[str] = None
     genre: Optional[str] = None
-    total_movies: Optional[int] = None
+    total_movies: Optional[int] = 0
     status: str = "ongoing"  # ongoing, completed, cancelled
     movie_ids: List[str] = []
     notes: Optional[str] = None
-    tags: List[str] = []
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    tags: Tuple[str, ...] = ()
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
+
+    @field_validator("total_movies", mode="before")
+    @classmethod
+    def count_missing_as_zero(cls, value):
+        # Collections stored before the count was maintained hold null
+        return 0 if value is None else value
 
     class Config:
         collection_name = "acm_movie_collections"
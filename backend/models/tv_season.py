@@ -1,13 +1,13 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 from pydantic import BaseModel, Field
-from .base import BaseDBModel
+from .base import BaseDBModel, DescriptionStr, TitleStr
 
 class TVSeasonBase(BaseModel):
     show_id: str = Field(..., description="ID of the TV show this season belongs to")
     season_number: int = Field(..., ge=1, description="Season number (1-based)")
-    title: str = Field(..., min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=1000)
+    title: TitleStr
+    description: Optional[DescriptionStr] = None
     air_date: Optional[datetime] = None
     episodes_count: int = Field(0, ge=0)
     poster_url: Optional[str] = None
@@ -18,8 +18,8 @@ class TVSeasonCreate(TVSeasonBase):
     pass
 
 class TVSeasonUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=1000)
+    title: Optional[TitleStr] = None
+    description: Optional[DescriptionStr] = None
     air_date: Optional[datetime] = None
     episodes_count: Optional[int] = Field(None, ge=0)
     poster_url: Optional[str] = None
@@ -27,9 +27,24 @@ class TVSeasonUpdate(BaseModel):
     tmdb_id: Optional[int] = None
 
 class TVSeasonInDB(TVSeasonBase, BaseDBModel):
-    pass
+    # Denormalized from the parent show, kept in sync on show updates
+    show_title: Optional[str] = None
+    show_poster_url: Optional[str] = None
+
+    class Config:
+        collection_name = "acm_tv_seasons"
+        frozen = True
+        indexes = [
+            # Serves a show's seasons in _id order for after_id pagination
+            {"key": [("show_id", 1), ("_id", 1)]}
+        ]
 
 class TVSeason(TVSeasonBase):
     id: str
+    show_title: Optional[str] = None
+    show_poster_url: Optional[str] = None
     created_at: datetime
-    updated_at: datetime 
\ No newline at end of file
+    updated_at: datetime
+
+    class Config:
+        frozen = True
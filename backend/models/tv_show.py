@@ -1,17 +1,17 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional, Tuple
 from pydantic import BaseModel, Field
-from .base import BaseDBModel
+from .base import BaseDBModel, DescriptionStr, ImdbIdStr, TitleStr
 
 class TVShowBase(BaseModel):
-    title: str = Field(..., min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=1000)
+    title: TitleStr
+    description: Optional[DescriptionStr] = None
     release_year: Optional[int] = Field(None, ge=1900, le=datetime.now().year)
-    genres: List[str] = Field(default_factory=list)
+    genres: Tuple[str, ...] = ()
     rating: Optional[float] = Field(None, ge=0, le=10)
     poster_url: Optional[str] = None
     backdrop_url: Optional[str] = None
-    imdb_id: Optional[str] = None
+    imdb_id: Optional[ImdbIdStr] = None
     tmdb_id: Optional[int] = None
     status: str = Field(..., description="Current status of the show (e.g., 'Ended', 'Ongoing', 'Cancelled')")
     network: Optional[str] = None
@@ -24,14 +24,14 @@ class TVShowCreate(TVShowBase):
     pass
 
 class TVShowUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=1000)
+    title: Optional[TitleStr] = None
+    description: Optional[DescriptionStr] = None
     release_year: Optional[int] = Field(None, ge=1900, le=datetime.now().year)
-    genres: Optional[List[str]] = None
+    genres: Optional[Tuple[str, ...]] = None
     rating: Optional[float] = Field(None, ge=0, le=10)
     poster_url: Optional[str] = None
     backdrop_url: Optional[str] = None
-    imdb_id: Optional[str] = None
+    imdb_id: Optional[ImdbIdStr] = None
     tmdb_id: Optional[int] = None
     status: Optional[str] = None
     network: Optional[str] = None
@@ -41,9 +41,24 @@ class TVShowUpdate(BaseModel):
     next_air_date: Optional[datetime] = None
 
 class TVShowInDB(TVShowBase, BaseDBModel):
-    pass
+    class Config:
+        collection_name = "acm_tv_shows"
+        frozen = True
+        indexes = [
+            # Serves status-filtered listings in _id order for after_id pagination
+            {"key": [("status", 1), ("_id", 1)]}
+        ]
 
 class TVShow(TVShowBase):
     id: str
     created_at: datetime
-    updated_at: datetime 
\ No newline at end of file
+    updated_at: datetime
+
+    class Config:
+        frozen = True
+
+class TVShowSummary(BaseModel):
+    id: str
+    title: str
+    poster_url: Optional[str] = None
+    release_year: Optional[int] = None
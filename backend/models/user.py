@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
+from .base import utcnow
 
 class User(BaseModel):
     id: Optional[str] = Field(None, alias="_id")
@@ -9,8 +10,8 @@ class User(BaseModel):
     password: str
     is_active: bool = True
     is_superuser: bool = False
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     last_login: Optional[datetime] = None
 
     class Config:
@@ -24,4 +25,8 @@ class User(BaseModel):
                 "is_superuser": False
             }
         }
-        populate_by_name = True 
\ No newline at end of file
+        populate_by_name = True
+        indexes = [
+            {"key": [("username", 1)], "unique": True},
+            {"key": [("email", 1)], "unique": True}
+        ]
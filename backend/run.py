@@ -2,6 +2,7 @@
 Script to run the FastAPI application with the correct port from environment.
 """
 
+import os
 import uvicorn
 from config.environment import logger, get_environment, get_port, get_log_file
 import logging
@@ -33,16 +34,26 @@ if __name__ == "__main__":
     uvicorn_logger = logging.getLogger("uvicorn")
     uvicorn_logger.addHandler(file_handler)
     
-    # Create the config first
-    config = uvicorn.Config(
+    # Production runs one worker per CPU, on uvloop/httptools where installed; development keeps reload and debug logs
+    if get_environment() == "production":
+        server_options = {
+            "workers": os.cpu_count(),
+            "loop": "auto",
+            "http": "auto",
+            "log_level": "info",
+            "access_log": False
+        }
+    else:
+        server_options = {
+            "reload": True,
+            "log_level": "debug"
+        }
+    
+    # Run the server
+    uvicorn.run(
         "main:app", 
         host="0.0.0.0", 
         port=port,
-        reload=True,
         log_config=log_config,
-        log_level="debug"
+        **server_options
     )
-    
-    # Run the server
-    server = uvicorn.Server(config)
-    server.run() 
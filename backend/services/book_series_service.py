@@ -1,8 +1,10 @@
+from functools import lru_cache
 from typing import List, Optional
 from fastapi import HTTPException
+from pymongo import ReturnDocument
 from models.book_series import BookSeries
-from core.database import get_database
-from datetime import datetime
+from core.database import get_database, model_projection, search_cursor
+from models.base import stamp_created, utcnow
 
 class BookSeriesService:
     def __init__(self):
@@ -11,6 +13,7 @@ class BookSeriesService:
 
     async def create_series(self, series: BookSeries) -> BookSeries:
         """Create a new book series."""
+        stamp_created(series, utcnow())
         try:
             result = await self.collection.insert_one(series.dict())
             series.id = str(result.inserted_id)
@@ -27,20 +30,17 @@ class BookSeriesService:
 
     async def get_all_series(self) -> List[BookSeries]:
         """Get all book series."""
-        cursor = self.collection.find()
+        cursor = self.collection.find({}, model_projection(BookSeries))
         series = await cursor.to_list(length=None)
-        return [BookSeries(**s) for s in series]
+        # Documents come from our own collection, so skip re-validating them
+        return [BookSeries.model_construct(**s) for s in series]
 
     async def update_series(self, series_id: str, series: BookSeries) -> BookSeries:
-        """Update a book series."""
-        series.updated_at = datetime.utcnow()
-        result = await self.collection.update_one(
-            {"_id": series_id},
-            {"$set": series.dict(exclude={"id"})}
-        )
-        if result.modified_count == 0:
-            raise HTTPException(status_code=404, detail="Book series not found")
-        return series
+        """Update the fields that were set on a book series."""
+        update_doc = series.model_dump(exclude_unset=True, exclude={"id"})
+        if not update_doc:
+            return series
+        return await self._update(series_id, {"$set": update_doc})
 
     async def delete_series(self, series_id: str) -> bool:
         """Delete a book series."""
@@ -51,34 +51,34 @@ class BookSeriesService:
 
     async def search_series(self, query: str) -> List[BookSeries]:
         """Search book series by name or author."""
-        cursor = self.collection.find({
-            "$or": [
-                {"name": {"$regex": query, "$options": "i"}},
-                {"author": {"$regex": query, "$options": "i"}}
-            ]
-        })
+        cursor = search_cursor(self.collection, query, model_projection(BookSeries))
         series = await cursor.to_list(length=None)
         return [BookSeries(**s) for s in series]
 
     async def add_book_to_series(self, series_id: str, book_id: str) -> BookSeries:
         """Add a book to a series."""
-        series = await self.get_series(series_id)
-        if book_id not in series.book_ids:
-            series.book_ids.append(book_id)
-            return await self.update_series(series_id, series)
-        return series
+        return await self._update(series_id, {"$addToSet": {"book_ids": book_id}})
 
     async def remove_book_from_series(self, series_id: str, book_id: str) -> BookSeries:
         """Remove a book from a series."""
-        series = await self.get_series(series_id)
-        if book_id in series.book_ids:
-            series.book_ids.remove(book_id)
-            return await self.update_series(series_id, series)
-        return series
+        return await self._update(series_id, {"$pull": {"book_ids": book_id}})
 
     async def update_series_status(self, series_id: str, status: str) -> BookSeries:
         """Update a book series's status."""
-        series = await self.get_series(series_id)
-        series.status = status
-        series.updated_at = datetime.utcnow()
-        return await self.update_series(series_id, series)
+        return await self._update(series_id, {"$set": {"status": status}})
+
+    async def _update(self, series_id: str, update: dict) -> BookSeries:
+        """Apply an update atomically, stamp updated_at and return the updated series."""
+        update.setdefault("$set", {})["updated_at"] = utcnow()
+        series = await self.collection.find_one_and_update(
+            {"_id": series_id},
+            update,
+            return_document=ReturnDocument.AFTER
+        )
+        if not series:
+            raise HTTPException(status_code=404, detail="Book series not found")
+        return BookSeries(**series)
+
+@lru_cache(maxsize=1)
+def get_book_series_service() -> BookSeriesService:
+    return BookSeriesService()
@@ -1,8 +1,13 @@
+from functools import lru_cache
 from typing import List, Optional
 from fastapi import HTTPException
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 from models.book import Book
-from core.database import get_database
-from datetime import datetime
+from core.database import get_database, model_projection, search_cursor
+from models.base import stamp_created, utcnow
+
+REQUIRED_FIELDS = ("title", "author")
 
 class BookService:
     def __init__(self):
@@ -11,6 +16,7 @@ class BookService:
 
     async def create_book(self, book: Book) -> Book:
         """Create a new book."""
+        stamp_created(book, utcnow())
         try:
             result = await self.collection.insert_one(book.dict())
             book.id = str(result.inserted_id)
@@ -18,6 +24,32 @@ class BookService:
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
+    async def create_books(self, books: List[Book]) -> List[Book]:
+        """Create several books in a single round trip."""
+        if not books:
+            return []
+        # One timestamp for the whole batch, unless the client supplied its own
+        now = utcnow()
+        for book in books:
+            stamp_created(book, now)
+        # insert_many sets each document's _id, so the stored IDs are known even on failure
+        documents = [book.dict() for book in books]
+        try:
+            await self.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            # Unordered inserts keep going past a failed book, so report what was stored
+            errors = {error["index"]: error["errmsg"] for error in e.details.get("writeErrors", [])}
+            raise HTTPException(status_code=400, detail={
+                "message": "Some books could not be created",
+                "inserted_ids": [str(document["_id"]) for index, document in enumerate(documents) if index not in errors],
+                "errors": [{"index": index, "error": error} for index, error in errors.items()]
+            })
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        for book, document in zip(books, documents):
+            book.id = str(document["_id"])
+        return books
+
     async def get_book(self, book_id: str) -> Optional[Book]:
         """Get a book by ID."""
         book = await self.collection.find_one({"_id": book_id})
@@ -25,22 +57,25 @@ class BookService:
             raise HTTPException(status_code=404, detail="Book not found")
         return Book(**book)
 
-    async def get_all_books(self) -> List[Book]:
-        """Get all books."""
-        cursor = self.collection.find()
-        books = await cursor.to_list(length=None)
-        return [Book(**b) for b in books]
+    async def get_all_books(self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None) -> List[Book]:
+        """Get a page of books, optionally restricted to the given fields."""
+        projection = model_projection(Book)
+        if fields:
+            unknown = sorted(set(fields) - Book.model_fields.keys())
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown book fields: {', '.join(unknown)}")
+            # Required fields are always returned so the page still validates as List[Book]
+            projection = {Book.model_fields[field].alias or field: 1 for field in [*fields, *REQUIRED_FIELDS]}
+        cursor = self.collection.find({}, projection).skip(skip).limit(limit)
+        # Documents come from our own collection, so skip re-validating them
+        return [Book.model_construct(**b) async for b in cursor]
 
     async def update_book(self, book_id: str, book: Book) -> Book:
-        """Update a book."""
-        book.updated_at = datetime.utcnow()
-        result = await self.collection.update_one(
-            {"_id": book_id},
-            {"$set": book.dict(exclude={"id"})}
-        )
-        if result.modified_count == 0:
-            raise HTTPException(status_code=404, detail="Book not found")
-        return book
+        """Update the fields that were set on a book."""
+        update_doc = book.model_dump(exclude_unset=True, exclude={"id"})
+        if not update_doc:
+            return book
+        return await self._set_fields(book_id, update_doc)
 
     async def delete_book(self, book_id: str) -> bool:
         """Delete a book."""
@@ -51,30 +86,36 @@ class BookService:
 
     async def search_books(self, query: str) -> List[Book]:
         """Search books by title, author, or genre."""
-        cursor = self.collection.find({
-            "$or": [
-                {"title": {"$regex": query, "$options": "i"}},
-                {"author": {"$regex": query, "$options": "i"}},
-                {"genre": {"$regex": query, "$options": "i"}}
-            ]
-        })
+        cursor = search_cursor(self.collection, query, model_projection(Book))
         books = await cursor.to_list(length=None)
         return [Book(**b) for b in books]
 
     async def get_books_by_series(self, series_id: str) -> List[Book]:
         """Get all books in a series."""
-        cursor = self.collection.find({"series_id": series_id})
+        cursor = self.collection.find({"series_id": series_id}, model_projection(Book))
         books = await cursor.to_list(length=None)
         return [Book(**b) for b in books]
 
     async def update_book_status(self, book_id: str, status: str) -> Book:
         """Update a book's status."""
-        book = await self.get_book(book_id)
-        book.status = status
-        return await self.update_book(book_id, book)
+        return await self._set_fields(book_id, {"status": status})
 
     async def update_book_rating(self, book_id: str, rating: int) -> Book:
         """Update a book's rating."""
-        book = await self.get_book(book_id)
-        book.rating = rating
-        return await self.update_book(book_id, book)
+        return await self._set_fields(book_id, {"rating": rating})
+
+    async def _set_fields(self, book_id: str, fields: dict) -> Book:
+        """Set the given fields on a book and return the updated book."""
+        fields["updated_at"] = utcnow()
+        book = await self.collection.find_one_and_update(
+            {"_id": book_id},
+            {"$set": fields},
+            return_document=ReturnDocument.AFTER
+        )
+        if not book:
+            raise HTTPException(status_code=404, detail="Book not found")
+        return Book(**book)
+
+@lru_cache(maxsize=1)
+def get_book_service() -> BookService:
+    return BookService()
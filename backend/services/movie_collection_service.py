@@ -1,8 +1,12 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 from fastapi import HTTPException
+from pymongo import ReturnDocument
 from models.movie_collection import MovieCollection
-from core.database import get_database
-from datetime import datetime
+from core.database import get_database, model_projection
+from models.base import stamp_created, utcnow
+
+STREAM_BATCH_SIZE = 1000
 
 class MovieCollectionService:
     def __init__(self):
@@ -11,6 +15,7 @@ class MovieCollectionService:
 
     async def create_collection(self, collection: MovieCollection) -> MovieCollection:
         """Create a new movie collection."""
+        stamp_created(collection, utcnow())
         try:
             result = await self.collection.insert_one(collection.dict())
             collection.id = str(result.inserted_id)
@@ -27,20 +32,34 @@ class MovieCollectionService:
 
     async def get_all_collections(self) -> List[MovieCollection]:
         """Get all movie collections."""
-        cursor = self.collection.find()
+        cursor = self.collection.find({}, model_projection(MovieCollection))
         collections = await cursor.to_list(length=None)
-        return [MovieCollection(**c) for c in collections]
+        # Documents come from our own collection, so skip re-validating them
+        return [MovieCollection.model_construct(**c) for c in collections]
+
+    async def iter_all_collections(self) -> AsyncIterator[MovieCollection]:
+        """Stream all movie collections, fetching documents in large batches."""
+        cursor = self.collection.find({}, model_projection(MovieCollection)).batch_size(STREAM_BATCH_SIZE)
+        async for collection in cursor:
+            # Skipping validation also skips reading a stored null total_movies as 0
+            if collection.get("total_movies") is None:
+                collection["total_movies"] = 0
+            yield MovieCollection.model_construct(**collection)
 
     async def update_collection(self, collection_id: str, collection: MovieCollection) -> MovieCollection:
-        """Update a movie collection."""
-        collection.updated_at = datetime.utcnow()
-        result = await self.collection.update_one(
+        """Update the fields that were set on a movie collection."""
+        update_doc = collection.model_dump(exclude_unset=True, exclude={"id"})
+        if not update_doc:
+            return collection
+        update_doc["updated_at"] = utcnow()
+        updated = await self.collection.find_one_and_update(
             {"_id": collection_id},
-            {"$set": collection.dict(exclude={"id"})}
+            {"$set": update_doc},
+            return_document=ReturnDocument.AFTER
         )
-        if result.modified_count == 0:
+        if not updated:
             raise HTTPException(status_code=404, detail="Collection not found")
-        return collection
+        return MovieCollection(**updated)
 
     async def delete_collection(self, collection_id: str) -> bool:
         """Delete a movie collection."""
@@ -51,18 +70,38 @@ class MovieCollectionService:
 
     async def add_movie_to_collection(self, collection_id: str, movie_id: str) -> MovieCollection:
         """Add a movie to a collection."""
-        collection = await self.get_collection(collection_id)
-        if movie_id not in collection.movies:
-            collection.movies.append(movie_id)
-            collection.total_movies += 1
-            await self.update_collection(collection_id, collection)
-        return collection
+        return await self._update_movies(
+            collection_id,
+            {"movie_ids": {"$ne": movie_id}},
+            # $literal keeps an ID such as "$name" from being read as a field path
+            {"$concatArrays": [{"$ifNull": ["$movie_ids", []]}, [{"$literal": movie_id}]]}
+        )
 
     async def remove_movie_from_collection(self, collection_id: str, movie_id: str) -> MovieCollection:
         """Remove a movie from a collection."""
-        collection = await self.get_collection(collection_id)
-        if movie_id in collection.movies:
-            collection.movies.remove(movie_id)
-            collection.total_movies -= 1
-            await self.update_collection(collection_id, collection)
-        return collection
+        return await self._update_movies(
+            collection_id,
+            {"movie_ids": movie_id},
+            {"$filter": {"input": "$movie_ids", "cond": {"$ne": ["$$this", {"$literal": movie_id}]}}}
+        )
+
+    async def _update_movies(self, collection_id: str, condition: dict, movie_ids: dict) -> MovieCollection:
+        """Atomically update a collection's movies when the condition holds."""
+        # A pipeline update recounts total_movies from the list, so documents
+        # stored with total_movies: null are corrected rather than rejected by $inc
+        collection = await self.collection.find_one_and_update(
+            {"_id": collection_id, **condition},
+            [
+                {"$set": {"movie_ids": movie_ids, "updated_at": utcnow()}},
+                {"$set": {"total_movies": {"$size": "$movie_ids"}}}
+            ],
+            return_document=ReturnDocument.AFTER
+        )
+        if not collection:
+            # Either the collection does not exist or there was nothing to change
+            return await self.get_collection(collection_id)
+        return MovieCollection(**collection)
+
+@lru_cache(maxsize=1)
+def get_movie_collection_service() -> MovieCollectionService:
+    return MovieCollectionService()
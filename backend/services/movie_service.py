@@ -1,8 +1,12 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 from fastapi import HTTPException
+from pymongo import ReturnDocument
 from models.movie import Movie
-from core.database import get_database
-from datetime import datetime
+from core.database import get_database, model_projection, search_cursor
+from models.base import stamp_created, utcnow
+
+STREAM_BATCH_SIZE = 1000
 
 class MovieService:
     def __init__(self):
@@ -11,6 +15,7 @@ class MovieService:
 
     async def create_movie(self, movie: Movie) -> Movie:
         """Create a new movie."""
+        stamp_created(movie, utcnow())
         try:
             result = await self.collection.insert_one(movie.dict())
             movie.id = str(result.inserted_id)
@@ -27,20 +32,23 @@ class MovieService:
 
     async def get_all_movies(self) -> List[Movie]:
         """Get all movies."""
-        cursor = self.collection.find()
+        cursor = self.collection.find({}, model_projection(Movie))
         movies = await cursor.to_list(length=None)
-        return [Movie(**m) for m in movies]
+        # Documents come from our own collection, so skip re-validating them
+        return [Movie.model_construct(**m) for m in movies]
+
+    async def iter_all_movies(self) -> AsyncIterator[Movie]:
+        """Stream all movies, fetching documents in large batches."""
+        async for movie in self.collection.find({}, model_projection(Movie)).batch_size(STREAM_BATCH_SIZE):
+            # Documents come from our own collection, so skip re-validating them
+            yield Movie.model_construct(**movie)
 
     async def update_movie(self, movie_id: str, movie: Movie) -> Movie:
-        """Update a movie."""
-        movie.updated_at = datetime.utcnow()
-        result = await self.collection.update_one(
-            {"_id": movie_id},
-            {"$set": movie.dict(exclude={"id"})}
-        )
-        if result.modified_count == 0:
-            raise HTTPException(status_code=404, detail="Movie not found")
-        return movie
+        """Update the fields that were set on a movie."""
+        update_doc = movie.model_dump(exclude_unset=True, exclude={"id"})
+        if not update_doc:
+            return movie
+        return await self._set_fields(movie_id, update_doc)
 
     async def delete_movie(self, movie_id: str) -> bool:
         """Delete a movie."""
@@ -51,30 +59,36 @@ class MovieService:
 
     async def search_movies(self, query: str) -> List[Movie]:
         """Search movies by title, director, or genre."""
-        cursor = self.collection.find({
-            "$or": [
-                {"title": {"$regex": query, "$options": "i"}},
-                {"director": {"$regex": query, "$options": "i"}},
-                {"genre": {"$regex": query, "$options": "i"}}
-            ]
-        })
+        cursor = search_cursor(self.collection, query, model_projection(Movie))
         movies = await cursor.to_list(length=None)
         return [Movie(**m) for m in movies]
 
     async def get_movies_by_collection(self, collection_id: str) -> List[Movie]:
         """Get all movies in a collection."""
-        cursor = self.collection.find({"collection_id": collection_id})
+        cursor = self.collection.find({"collection_id": collection_id}, model_projection(Movie))
         movies = await cursor.to_list(length=None)
         return [Movie(**m) for m in movies]
 
     async def update_movie_status(self, movie_id: str, status: str) -> Movie:
         """Update a movie's status."""
-        movie = await self.get_movie(movie_id)
-        movie.status = status
-        return await self.update_movie(movie_id, movie)
+        return await self._set_fields(movie_id, {"status": status})
 
     async def update_movie_rating(self, movie_id: str, rating: int) -> Movie:
         """Update a movie's rating."""
-        movie = await self.get_movie(movie_id)
-        movie.rating = rating
-        return await self.update_movie(movie_id, movie)
+        return await self._set_fields(movie_id, {"rating": rating})
+
+    async def _set_fields(self, movie_id: str, fields: dict) -> Movie:
+        """Set the given fields on a movie and return the updated movie."""
+        fields["updated_at"] = utcnow()
+        movie = await self.collection.find_one_and_update(
+            {"_id": movie_id},
+            {"$set": fields},
+            return_document=ReturnDocument.AFTER
+        )
+        if not movie:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        return Movie(**movie)
+
+@lru_cache(maxsize=1)
+def get_movie_service() -> MovieService:
+    return MovieService()
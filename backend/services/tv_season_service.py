@@ -1,59 +1,88 @@
+from functools import lru_cache
 from typing import List, Optional
-from datetime import datetime
+from models.base import utcnow
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from config.database import get_database
+from core.database import convert_id, get_database, model_projection, parse_object_id
 from models.tv_season import TVSeason, TVSeasonCreate, TVSeasonUpdate, TVSeasonInDB
+from models.tv_show import TVShowInDB
 from bson import ObjectId
+from pymongo import ReturnDocument
 
 class TVSeasonService:
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
-        self.collection = db.acm_tv_seasons
+        self.collection = db[TVSeasonInDB.Config.collection_name]
 
     async def create_tv_season(self, tv_season: TVSeasonCreate) -> TVSeason:
         tv_season_dict = tv_season.dict()
-        tv_season_dict["created_at"] = datetime.utcnow()
-        tv_season_dict["updated_at"] = datetime.utcnow()
+        tv_season_dict.update(await self._get_show_summary(tv_season.show_id))
+        now = utcnow()
+        tv_season_dict["created_at"] = now
+        tv_season_dict["updated_at"] = now
         
-        result = await self.collection.insert_one(tv_season_dict)
-        created_tv_season = await self.collection.find_one({"_id": result.inserted_id})
-        return TVSeason(**self._convert_id(created_tv_season))
+        # insert_one adds the generated _id to tv_season_dict
+        await self.collection.insert_one(tv_season_dict)
+        return TVSeason(**convert_id(tv_season_dict))
 
     async def get_tv_season(self, tv_season_id: str) -> Optional[TVSeason]:
-        tv_season = await self.collection.find_one({"_id": ObjectId(tv_season_id)})
-        return TVSeason(**self._convert_id(tv_season)) if tv_season else None
+        tv_season = await self.collection.find_one({"_id": parse_object_id(tv_season_id)})
+        return TVSeason(**convert_id(tv_season)) if tv_season else None
 
     async def get_tv_seasons_by_show(
         self,
         show_id: str,
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        after_id: Optional[str] = None
     ) -> List[TVSeason]:
-        cursor = self.collection.find({"show_id": show_id}).skip(skip).limit(limit)
+        query = {"show_id": show_id}
+        if after_id:
+            # Resume after the last season of the previous page instead of skipping over it
+            query["_id"] = {"$gt": parse_object_id(after_id)}
+        cursor = self.collection.find(query, model_projection(TVSeasonInDB)).sort("_id", 1).skip(skip).limit(limit)
         tv_seasons = await cursor.to_list(length=limit)
-        return [TVSeason(**self._convert_id(tv_season)) for tv_season in tv_seasons]
+        # Documents come from our own collection, so skip re-validating them
+        return [TVSeason.model_construct(**convert_id(tv_season)) for tv_season in tv_seasons]
 
     async def update_tv_season(self, tv_season_id: str, tv_season: TVSeasonUpdate) -> Optional[TVSeason]:
         update_data = {k: v for k, v in tv_season.dict().items() if v is not None}
-        if update_data:
-            update_data["updated_at"] = datetime.utcnow()
-            await self.collection.update_one(
-                {"_id": ObjectId(tv_season_id)},
-                {"$set": update_data}
-            )
-        
-        updated_tv_season = await self.collection.find_one({"_id": ObjectId(tv_season_id)})
-        return TVSeason(**self._convert_id(updated_tv_season)) if updated_tv_season else None
+        if not update_data:
+            return await self.get_tv_season(tv_season_id)
+
+        update_data["updated_at"] = utcnow()
+        updated_tv_season = await self.collection.find_one_and_update(
+            {"_id": parse_object_id(tv_season_id)},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
+        )
+        return TVSeason(**convert_id(updated_tv_season)) if updated_tv_season else None
 
     async def delete_tv_season(self, tv_season_id: str) -> bool:
-        result = await self.collection.delete_one({"_id": ObjectId(tv_season_id)})
+        result = await self.collection.delete_one({"_id": parse_object_id(tv_season_id)})
         return result.deleted_count > 0
 
-    def _convert_id(self, document: dict) -> dict:
-        if document:
-            document["id"] = str(document.pop("_id"))
-        return document
+    async def backfill_show_summaries(self) -> int:
+        """Copy the show title and poster onto seasons stored before they were denormalized."""
+        missing = {"show_title": {"$exists": False}}
+        backfilled = 0
+        for show_id in await self.collection.distinct("show_id", missing):
+            result = await self.collection.update_many(
+                {"show_id": show_id, **missing},
+                {"$set": await self._get_show_summary(show_id)}
+            )
+            backfilled += result.modified_count
+        return backfilled
+
+    async def _get_show_summary(self, show_id: str) -> dict:
+        if not ObjectId.is_valid(show_id):
+            return {"show_title": None, "show_poster_url": None}
+        show = await self.db[TVShowInDB.Config.collection_name].find_one(
+            {"_id": ObjectId(show_id)},
+            {"title": 1, "poster_url": 1}
+        ) or {}
+        return {"show_title": show.get("title"), "show_poster_url": show.get("poster_url")}
 
+@lru_cache(maxsize=1)
 def get_tv_season_service() -> TVSeasonService:
     db = get_database()
     return TVSeasonService(db) 
\ No newline at end of file
@@ -1,66 +1,118 @@
+from functools import lru_cache
 from typing import List, Optional
-from datetime import datetime
+from models.base import utcnow
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from config.database import get_database
-from models.tv_show import TVShow, TVShowCreate, TVShowUpdate, TVShowInDB
-from bson import ObjectId
+from core.database import convert_id, get_database, model_projection, parse_object_id
+from models.tv_show import TVShow, TVShowCreate, TVShowUpdate, TVShowInDB, TVShowSummary
+from models.tv_season import TVSeasonInDB
+from pymongo import ReturnDocument
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+# Fields decoded for list views; everything else stays as raw BSON
+SUMMARY_PROJECTION = {"title": 1, "poster_url": 1, "release_year": 1}
+
+# Show fields duplicated onto each of its seasons
+SEASON_DENORMALIZED_FIELDS = {"title": "show_title", "poster_url": "show_poster_url"}
 
 class TVShowService:
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
-        self.collection = db.acm_tv_shows
+        self.collection = db[TVShowInDB.Config.collection_name]
+        self.raw_collection = self.collection.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
 
     async def create_tv_show(self, tv_show: TVShowCreate) -> TVShow:
         tv_show_dict = tv_show.dict()
-        tv_show_dict["created_at"] = datetime.utcnow()
-        tv_show_dict["updated_at"] = datetime.utcnow()
+        now = utcnow()
+        tv_show_dict["created_at"] = now
+        tv_show_dict["updated_at"] = now
         
-        result = await self.collection.insert_one(tv_show_dict)
-        created_tv_show = await self.collection.find_one({"_id": result.inserted_id})
-        return TVShow(**self._convert_id(created_tv_show))
+        # insert_one adds the generated _id to tv_show_dict
+        await self.collection.insert_one(tv_show_dict)
+        return TVShow(**convert_id(tv_show_dict))
 
     async def get_tv_show(self, tv_show_id: str) -> Optional[TVShow]:
-        tv_show = await self.collection.find_one({"_id": ObjectId(tv_show_id)})
-        return TVShow(**self._convert_id(tv_show)) if tv_show else None
+        tv_show = await self.collection.find_one({"_id": parse_object_id(tv_show_id)})
+        return TVShow(**convert_id(tv_show)) if tv_show else None
 
     async def get_tv_shows(
         self,
         skip: int = 0,
         limit: int = 10,
         title: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        after_id: Optional[str] = None
     ) -> List[TVShow]:
-        query = {}
-        if title:
-            query["title"] = {"$regex": title, "$options": "i"}
-        if status:
-            query["status"] = status
-
-        cursor = self.collection.find(query).skip(skip).limit(limit)
+        query = self._build_query(title, status, after_id)
+        cursor = self.collection.find(query, model_projection(TVShowInDB)).sort("_id", 1).skip(skip).limit(limit)
         tv_shows = await cursor.to_list(length=limit)
-        return [TVShow(**self._convert_id(tv_show)) for tv_show in tv_shows]
+        # Documents come from our own collection, so skip re-validating them
+        return [TVShow.model_construct(**convert_id(tv_show)) for tv_show in tv_shows]
+
+    async def get_tv_show_summaries(
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        title: Optional[str] = None,
+        status: Optional[str] = None,
+        after_id: Optional[str] = None
+    ) -> List[TVShowSummary]:
+        query = self._build_query(title, status, after_id)
+        cursor = self.raw_collection.find(query, SUMMARY_PROJECTION).sort("_id", 1).skip(skip).limit(limit)
+        return [
+            TVShowSummary(
+                id=raw["_id"].binary.hex(),
+                title=raw["title"],
+                poster_url=raw.get("poster_url"),
+                release_year=raw.get("release_year")
+            )
+            async for raw in cursor
+        ]
 
     async def update_tv_show(self, tv_show_id: str, tv_show: TVShowUpdate) -> Optional[TVShow]:
         update_data = {k: v for k, v in tv_show.dict().items() if v is not None}
-        if update_data:
-            update_data["updated_at"] = datetime.utcnow()
-            await self.collection.update_one(
-                {"_id": ObjectId(tv_show_id)},
-                {"$set": update_data}
+        if not update_data:
+            return await self.get_tv_show(tv_show_id)
+
+        update_data["updated_at"] = utcnow()
+        updated_tv_show = await self.collection.find_one_and_update(
+            {"_id": parse_object_id(tv_show_id)},
+            {"$set": update_data},
+            return_document=ReturnDocument.AFTER
+        )
+        if not updated_tv_show:
+            return None
+
+        season_data = {
+            season_field: update_data[show_field]
+            for show_field, season_field in SEASON_DENORMALIZED_FIELDS.items()
+            if show_field in update_data
+        }
+        if season_data:
+            await self.db[TVSeasonInDB.Config.collection_name].update_many(
+                {"show_id": tv_show_id},
+                {"$set": season_data}
             )
-        
-        updated_tv_show = await self.collection.find_one({"_id": ObjectId(tv_show_id)})
-        return TVShow(**self._convert_id(updated_tv_show)) if updated_tv_show else None
+        return TVShow(**convert_id(updated_tv_show))
 
     async def delete_tv_show(self, tv_show_id: str) -> bool:
-        result = await self.collection.delete_one({"_id": ObjectId(tv_show_id)})
+        result = await self.collection.delete_one({"_id": parse_object_id(tv_show_id)})
         return result.deleted_count > 0
 
-    def _convert_id(self, document: dict) -> dict:
-        if document:
-            document["id"] = str(document.pop("_id"))
-        return document
+    def _build_query(self, title: Optional[str], status: Optional[str], after_id: Optional[str] = None) -> dict:
+        query = {}
+        if title:
+            query["title"] = {"$regex": title, "$options": "i"}
+        if status:
+            query["status"] = status
+        if after_id:
+            # Resume after the last show of the previous page instead of skipping over it
+            query["_id"] = {"$gt": parse_object_id(after_id)}
+        return query
 
+@lru_cache(maxsize=1)
 def get_tv_show_service() -> TVShowService:
     db = get_database()
     return TVShowService(db) 
\ No newline at end of file
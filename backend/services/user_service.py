@@ -1,9 +1,23 @@
+import asyncio
+from functools import lru_cache
 from typing import Optional
 from fastapi import HTTPException
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from models.user import User
-from core.database import get_database
-from core.security import get_password_hash, verify_password
-from datetime import datetime
+from core.database import get_database, model_projection, parse_object_id
+from core.security import get_password_hash, is_password_hash, verify_and_update_password
+from models.base import stamp_created, utcnow
+
+def _duplicate_key_detail(error: DuplicateKeyError) -> str:
+    """Describe which unique user field a duplicate key error collided on."""
+    field = next(iter((error.details or {}).get("keyPattern", {})), "username")
+    return f"{field.capitalize()} already registered"
+
+def _to_user(document: dict) -> User:
+    """Build a User from a stored document, whose _id is an ObjectId."""
+    document["_id"] = str(document["_id"])
+    return User(**document)
 
 class UserService:
     def __init__(self):
@@ -12,62 +26,67 @@ class UserService:
 
     async def create_user(self, user: User) -> User:
         """Create a new user with hashed password."""
+        # Hash the password off the event loop
+        user.password = await asyncio.to_thread(get_password_hash, user.password)
+        stamp_created(user, utcnow())
         try:
-            # Check if username or email already exists
-            if await self.collection.find_one({"username": user.username}):
-                raise HTTPException(status_code=400, detail="Username already registered")
-            if await self.collection.find_one({"email": user.email}):
-                raise HTTPException(status_code=400, detail="Email already registered")
-
-            # Hash the password
-            user.password = get_password_hash(user.password.get_secret_value())
-            
+            # Startup fails without the unique username and email indexes, which reject duplicates atomically
             result = await self.collection.insert_one(user.dict())
-            user.id = str(result.inserted_id)
-            return user
+        except DuplicateKeyError as e:
+            raise HTTPException(status_code=400, detail=_duplicate_key_detail(e))
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
+        user.id = str(result.inserted_id)
+        return user
 
     async def get_user(self, user_id: str) -> Optional[User]:
         """Get a user by ID."""
-        user = await self.collection.find_one({"_id": user_id})
+        user = await self.collection.find_one({"_id": parse_object_id(user_id)})
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
-        return User(**user)
+        return _to_user(user)
 
     async def get_user_by_username(self, username: str) -> Optional[User]:
         """Get a user by username."""
-        user = await self.collection.find_one({"username": username})
+        user = await self.collection.find_one({"username": username}, model_projection(User))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
-        return User(**user)
+        return _to_user(user)
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get a user by email."""
         user = await self.collection.find_one({"email": email})
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
-        return User(**user)
+        return _to_user(user)
 
     async def update_user(self, user_id: str, user: User) -> User:
-        """Update a user."""
-        user.updated_at = datetime.utcnow()
-        
-        # If password is being updated, hash it
-        if user.password:
-            user.password = get_password_hash(user.password.get_secret_value())
+        """Update the fields that were set on a user."""
+        update_doc = user.model_dump(exclude_unset=True, exclude={"id"})
+        if not update_doc:
+            return user
 
-        result = await self.collection.update_one(
-            {"_id": user_id},
-            {"$set": user.dict(exclude={"id"})}
-        )
-        if result.modified_count == 0:
+        # Only hash a new plaintext password; an existing hash is stored as is
+        password = update_doc.get("password")
+        if password and not is_password_hash(password):
+            update_doc["password"] = await asyncio.to_thread(get_password_hash, password)
+
+        update_doc["updated_at"] = utcnow()
+        try:
+            updated = await self.collection.find_one_and_update(
+                {"_id": parse_object_id(user_id)},
+                {"$set": update_doc},
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError as e:
+            raise HTTPException(status_code=400, detail=_duplicate_key_detail(e))
+        if not updated:
             raise HTTPException(status_code=404, detail="User not found")
-        return user
+        return _to_user(updated)
 
     async def delete_user(self, user_id: str) -> bool:
         """Delete a user."""
-        result = await self.collection.delete_one({"_id": user_id})
+        result = await self.collection.delete_one({"_id": parse_object_id(user_id)})
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="User not found")
         return True
@@ -77,10 +96,23 @@ class UserService:
         user = await self.get_user_by_username(username)
         if not user:
             return None
-        if not verify_password(password, user.password.get_secret_value()):
+        verified, new_hash = await asyncio.to_thread(verify_and_update_password, password, user.password)
+        if not verified:
             return None
         
-        # Update last login
-        user.last_login = datetime.utcnow()
-        await self.update_user(user.id, user)
+        # Update last login only, leaving the rest of the document untouched
+        user.last_login = utcnow()
+        update = {"last_login": user.last_login}
+        if new_hash:
+            # A bcrypt hash is replaced by an Argon2 one now that the plaintext is known
+            user.password = new_hash
+            update["password"] = new_hash
+        await self.collection.update_one(
+            {"_id": parse_object_id(user.id)},
+            {"$set": update}
+        )
         return user
+
+@lru_cache(maxsize=1)
+def get_user_service() -> UserService:
+    return UserService()
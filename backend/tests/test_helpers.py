@@ -0,0 +1,79 @@
+"""
+Tests for the database and service helpers that need no database.
+"""
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo.errors import DuplicateKeyError
+from core.database import parse_object_id, search_cursor
+from core.security import is_password_hash, verify_and_update_password
+from services.user_service import _duplicate_key_detail, _to_user
+
+ARGON2_HASH = "$argon2id$v=19$m=19456,t=2,p=1$4rz3HiNEiDEGYAxBiNG6dw$XwU/nTP8DrLIAlRptcaT74Q1xdU8oY1MTvdP4qCyjkQ"
+BCRYPT_HASH = "$2b$04$KjXyC9dssdXbGlBNSZxAgu4D/jpSn1bkLYez615XNR71sSYfrbO7C"
+
+class RecordingCollection:
+    """Stands in for a collection, recording the query search_cursor builds."""
+
+    def find(self, filter, projection=None):
+        self.filter = filter
+        self.projection = projection
+        self.sort_key = None
+        return self
+
+    def sort(self, key):
+        self.sort_key = key
+        return self
+
+def test_parse_object_id_returns_an_object_id():
+    assert parse_object_id("5f0c6d3e9b1e8a3d4c2b1a09") == ObjectId("5f0c6d3e9b1e8a3d4c2b1a09")
+
+@pytest.mark.parametrize("value", ["nope", "5f0c6d3e9b1e8a3d4c2b1a0", ""])
+def test_parse_object_id_rejects_malformed_ids_with_400(value):
+    with pytest.raises(HTTPException) as error:
+        parse_object_id(value)
+    assert error.value.status_code == 400
+
+@pytest.mark.parametrize("query", ["to", "tol", "tolkien"])
+def test_search_cursor_uses_the_text_index_for_every_query(query):
+    collection = search_cursor(RecordingCollection(), query, {"title": 1})
+    assert collection.filter == {"$text": {"$search": query}}
+    assert collection.projection == {"title": 1}
+    assert collection.sort_key == [("score", {"$meta": "textScore"})]
+
+@pytest.mark.parametrize("key_pattern,detail", [
+    ({"username": 1}, "Username already registered"),
+    ({"email": 1}, "Email already registered")
+])
+def test_duplicate_key_detail_names_the_colliding_field(key_pattern, detail):
+    error = DuplicateKeyError("E11000 duplicate key error", 11000, {"keyPattern": key_pattern})
+    assert _duplicate_key_detail(error) == detail
+
+def test_duplicate_key_detail_defaults_to_username():
+    assert _duplicate_key_detail(DuplicateKeyError("E11000 duplicate key error", 11000)) == "Username already registered"
+
+@pytest.mark.parametrize("value", [ARGON2_HASH, BCRYPT_HASH])
+def test_is_password_hash_recognizes_stored_hashes(value):
+    assert is_password_hash(value)
+
+@pytest.mark.parametrize("value", ["secret", "", "$2b$not-a-hash", "$argon2id$not-a-hash"])
+def test_is_password_hash_rejects_plaintext(value):
+    assert not is_password_hash(value)
+
+def test_bcrypt_hashes_still_verify_and_are_upgraded_to_argon2():
+    verified, new_hash = verify_and_update_password("secret", BCRYPT_HASH)
+    assert verified
+    assert new_hash.startswith("$argon2id$")
+
+def test_argon2_hashes_verify_without_an_upgrade():
+    assert verify_and_update_password("secret", ARGON2_HASH) == (True, None)
+
+def test_wrong_passwords_do_not_verify():
+    assert verify_and_update_password("wrong", BCRYPT_HASH) == (False, None)
+    assert verify_and_update_password("wrong", ARGON2_HASH) == (False, None)
+
+def test_to_user_exposes_the_stored_object_id_as_a_string():
+    user_id = ObjectId()
+    user = _to_user({"_id": user_id, "username": "johndoe", "email": "john@example.com", "password": BCRYPT_HASH})
+    assert user.id == str(user_id)
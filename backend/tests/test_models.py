@@ -0,0 +1,63 @@
+"""
+Tests for the model field types.
+"""
+
+from datetime import datetime, timezone
+import pytest
+from pydantic import ValidationError
+from models.base import stamp_created
+from models.movie_collection import MovieCollection
+from models.tv_show import TVShowUpdate
+from models.user import User
+
+def make_user(**kwargs) -> User:
+    return User(**{"username": "johndoe", "email": "john@example.com", "password": "secret", **kwargs})
+
+@pytest.mark.parametrize("imdb_id", ["tt0903747", "tt10048342"])
+def test_imdb_id_accepts_tt_prefixed_ids(imdb_id):
+    assert TVShowUpdate(imdb_id=imdb_id).imdb_id == imdb_id
+
+@pytest.mark.parametrize("imdb_id", ["0903747", "tt090374", "tt100483421", "nm0903747", " tt0903747", "tt\u0660\u0669\u0660\u0663\u0667\u0664\u0667"])
+def test_imdb_id_rejects_other_formats(imdb_id):
+    with pytest.raises(ValidationError):
+        TVShowUpdate(imdb_id=imdb_id)
+
+def test_title_must_not_be_empty():
+    with pytest.raises(ValidationError):
+        TVShowUpdate(title="")
+
+def test_title_is_limited_to_200_characters():
+    assert TVShowUpdate(title="x" * 200).title == "x" * 200
+    with pytest.raises(ValidationError):
+        TVShowUpdate(title="x" * 201)
+
+def test_description_is_limited_to_1000_characters():
+    assert TVShowUpdate(description="x" * 1000).description == "x" * 1000
+    with pytest.raises(ValidationError):
+        TVShowUpdate(description="x" * 1001)
+
+def test_user_email_is_normalized():
+    assert make_user(email="John@Example.COM").email == "John@example.com"
+
+def test_user_email_rejects_invalid_addresses():
+    with pytest.raises(ValidationError):
+        make_user(email="not-an-email")
+
+def test_user_email_keeps_the_email_format_in_the_schema():
+    assert User.model_json_schema()["properties"]["email"]["format"] == "email"
+
+def test_collection_total_movies_reads_stored_null_as_zero():
+    assert MovieCollection(**{"name": "Trilogy", "total_movies": None}).total_movies == 0
+    assert MovieCollection(name="Trilogy", total_movies=3).total_movies == 3
+
+def test_stamp_created_gives_both_timestamps_one_value():
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    collection = MovieCollection(name="Trilogy")
+    stamp_created(collection, now)
+    assert collection.created_at == collection.updated_at == now
+
+def test_stamp_created_keeps_client_supplied_timestamps():
+    created_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    collection = MovieCollection(name="Trilogy", created_at=created_at)
+    stamp_created(collection, datetime(2024, 1, 1, tzinfo=timezone.utc))
+    assert collection.created_at == created_at